@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import itertools
 import json
 import os
 import re
 import threading
-from typing import Any, Callable, Dict, Iterable, List, Mapping, NoReturn, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+)
 
 # These modules are added to the context. Consider alternative
 # approaches which will extend well to potentially many modules
@@ -111,7 +123,25 @@ def contextmember(value: Optional[str] = None) -> Callable:
 
 
 def contextproperty(value: Optional[str] = None) -> Callable:
-    return lambda v: ContextMember(property(v), name=value)
+    def wrap(v: Callable) -> ContextMember:
+        # Context properties are invariant for the lifetime of a context
+        # instance. to_dict() evaluates each one once, but properties that
+        # read each other (and any repeated to_dict calls) would re-run the
+        # getter, so cache the computed value per instance.
+        name = v.__name__
+
+        @functools.wraps(v)
+        def getter(self):
+            cache = self.__dict__.setdefault("_ctx_property_cache", {})
+            try:
+                return cache[name]
+            except KeyError:
+                result = cache[name] = v(self)
+                return result
+
+        return ContextMember(property(getter), name=value)
+
+    return wrap
 
 
 class ContextMeta(type):
@@ -133,6 +163,16 @@ class ContextMeta(type):
             new_dct[key] = value
         new_dct["_context_members_"] = context_members
         new_dct["_context_attrs_"] = context_attrs
+        # Specialize builtin generation per class: members that aren't
+        # descriptors always contribute the same value, so collect them in a
+        # template dict copied wholesale per context, and keep only the
+        # descriptors (properties, methods) for per-instance binding.
+        new_dct["_context_static_builtins_"] = {
+            key: value for key, value in context_members.items() if not hasattr(value, "__get__")
+        }
+        new_dct["_context_member_resolvers_"] = tuple(
+            (key, value) for key, value in context_members.items() if hasattr(value, "__get__")
+        )
         return type.__new__(mcls, name, bases, new_dct)
 
 
@@ -188,6 +228,8 @@ class BaseContext(metaclass=ContextMeta):
     # Set by ContextMeta
     _context_members_: Dict[str, Any]
     _context_attrs_: Dict[str, Any]
+    _context_static_builtins_: Dict[str, Any]
+    _context_member_resolvers_: Tuple[Tuple[str, Any], ...]
 
     # subclass is TargetContext
     def __init__(self, cli_vars: Dict[str, Any]) -> None:
@@ -196,12 +238,10 @@ class BaseContext(metaclass=ContextMeta):
         self.env_vars: Dict[str, Any] = {}
 
     def generate_builtins(self) -> Dict[str, Any]:
-        builtins: Dict[str, Any] = {}
-        for key, value in self._context_members_.items():
-            if hasattr(value, "__get__"):
-                # handle properties, bound methods, etc
-                value = value.__get__(self)
-            builtins[key] = value
+        builtins: Dict[str, Any] = dict(self._context_static_builtins_)
+        for key, value in self._context_member_resolvers_:
+            # handle properties, bound methods, etc
+            builtins[key] = value.__get__(self)
         return builtins
 
     # no dbtClassMixin so this is not an actual override
@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, MutableMapping, Optional
 
 from dbt.clients.jinja import MacroGenerator
@@ -60,18 +61,22 @@ class MacroResolver:
     def _build_macros_by_name(self) -> None:
         macros_by_name = {}
 
+        # Intern the names: contexts built from this resolver look the same
+        # macro names up over and over, and interned keys let those dict
+        # probes short-circuit on identity.
+
         # all internal packages (already in the right order)
         for macro in self.internal_packages_namespace.values():
-            macros_by_name[macro.name] = macro
+            macros_by_name[sys.intern(macro.name)] = macro
 
         # non-internal packages
         for fnamespace in self.packages.values():
             for macro in fnamespace.values():
-                macros_by_name[macro.name] = macro
+                macros_by_name[sys.intern(macro.name)] = macro
 
         # root package macros
         for macro in self.root_package_macros.values():
-            macros_by_name[macro.name] = macro
+            macros_by_name[sys.intern(macro.name)] = macro
 
         self.macros_by_name = macros_by_name
 
@@ -170,14 +175,24 @@ class TestMacroNamespace:
                     self.project_namespace[project_name][macro_name] = macro_gen
 
     def recursively_get_depends_on_macros(self, depends_on_macros, dep_macros):
-        for macro_unique_id in depends_on_macros:
-            if macro_unique_id in dep_macros:
-                continue
-            dep_macros.append(macro_unique_id)
-            if macro_unique_id in self.macro_resolver.macros:
-                macro = self.macro_resolver.macros[macro_unique_id]
-                if macro.depends_on.macros:
-                    self.recursively_get_depends_on_macros(macro.depends_on.macros, dep_macros)
+        # Iterative preorder walk with a visited set. The recursive version
+        # re-scanned the dep_macros list for every macro visited, which is
+        # quadratic in deep macro-call graphs, and risked hitting the
+        # recursion limit.
+        visited = set(dep_macros)
+        stack = [iter(depends_on_macros)]
+        while stack:
+            for macro_unique_id in stack[-1]:
+                if macro_unique_id in visited:
+                    continue
+                visited.add(macro_unique_id)
+                dep_macros.append(macro_unique_id)
+                macro = self.macro_resolver.macros.get(macro_unique_id)
+                if macro is not None and macro.depends_on.macros:
+                    stack.append(iter(macro.depends_on.macros))
+                    break
+            else:
+                stack.pop()
 
     def get_from_package(self, package_name: Optional[str], name: str) -> Optional[MacroGenerator]:
         macro = None
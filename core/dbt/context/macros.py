@@ -113,15 +113,10 @@ class MacroNamespaceBuilder:
         macro: Macro,
         macro_func: MacroGenerator,
     ):
-        if macro.package_name in hierarchy:
-            namespace = hierarchy[macro.package_name]
-        else:
-            namespace = {}
-            hierarchy[macro.package_name] = namespace
-
+        namespace = hierarchy.setdefault(macro.package_name, {})
         if macro.name in namespace:
             raise DuplicateMacroNameError(macro_func.macro, macro, macro.package_name)
-        hierarchy[macro.package_name][macro.name] = macro_func
+        namespace[macro.name] = macro_func
 
     def add_macro(self, macro: Macro, ctx: Dict[str, Any]) -> None:
         macro_name: str = macro.name
@@ -152,8 +147,32 @@ class MacroNamespaceBuilder:
     def build_namespace(
         self, macros_by_package: Dict[str, Dict[str, Macro]], ctx: Dict[str, Any]
     ) -> MacroNamespace:
-        for package in macros_by_package.values():
-            self.add_macros(package.values(), ctx)
+        # The macros are already grouped by package, so resolve the
+        # destination namespaces once per package instead of re-checking the
+        # package name for every macro; this loop runs over every macro in
+        # the manifest for every context built.
+        for package_name, package_macros in macros_by_package.items():
+            if not package_macros:
+                continue
+            locals_namespace: Optional[FlatNamespace] = None
+            globals_namespace: Optional[FlatNamespace] = None
+            if package_name in self.internal_package_names:
+                namespace = self.internal_packages.setdefault(package_name, {})
+            else:
+                namespace = self.packages.setdefault(package_name, {})
+                if package_name == self.search_package:
+                    locals_namespace = self.locals
+                elif package_name == self.root_package:
+                    globals_namespace = self.globals
+            for macro in package_macros.values():
+                macro_func = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
+                if macro.name in namespace:
+                    raise DuplicateMacroNameError(macro_func.macro, macro, package_name)
+                namespace[macro.name] = macro_func
+                if locals_namespace is not None:
+                    locals_namespace[macro.name] = macro_func
+                elif globals_namespace is not None:
+                    globals_namespace[macro.name] = macro_func
 
         # Iterate in reverse-order and overwrite: the packages that are first
         # in the list are the ones we want to "win".
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from dbt.adapters.contracts.connection import AdapterRequiredConfig
 from dbt.clients.jinja import MacroStack
@@ -9,6 +9,22 @@ from .base import contextproperty
 from .configured import ConfiguredContext
 from .macros import MacroNamespace, MacroNamespaceBuilder
 
+# Internal package names per adapter type. get_adapter_package_names walks
+# the adapter plugin graph, which yields the same answer for every context
+# built during a run; the list is only ever read by MacroNamespaceBuilder.
+_internal_packages_cache: Dict[Optional[str], List[str]] = {}
+
+
+def get_internal_package_names(adapter_type: Optional[str]) -> List[str]:
+    internal_packages = _internal_packages_cache.get(adapter_type)
+    if internal_packages is None:
+        # avoid an import loop
+        from dbt.adapters.factory import get_adapter_package_names
+
+        internal_packages = get_adapter_package_names(adapter_type)
+        _internal_packages_cache[adapter_type] = internal_packages
+    return internal_packages
+
 
 class ManifestContext(ConfiguredContext):
     """The Macro context has everything in the target context, plus the macros
@@ -42,10 +58,7 @@ class ManifestContext(ConfiguredContext):
         return builder.build_namespace(self.manifest.get_macros_by_package(), self._ctx)
 
     def _get_namespace_builder(self) -> MacroNamespaceBuilder:
-        # avoid an import loop
-        from dbt.adapters.factory import get_adapter_package_names
-
-        internal_packages: List[str] = get_adapter_package_names(self.config.credentials.type)
+        internal_packages: List[str] = get_internal_package_names(self.config.credentials.type)
         return MacroNamespaceBuilder(
             self.config.project_name,
             self.search_package,
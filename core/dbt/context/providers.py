@@ -1,19 +1,26 @@
 import abc
 import os
-from copy import deepcopy
+import sys
+import threading
+from collections import ChainMap
+from copy import copy
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
-    Iterable,
     List,
     Mapping,
+    NoReturn,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 
 from typing_extensions import Protocol
@@ -23,18 +30,8 @@ from dbt.adapters.base.column import Column
 from dbt.adapters.base.relation import EventTimeFilter
 from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.exceptions import MissingConfigError
-from dbt.adapters.factory import (
-    get_adapter,
-    get_adapter_package_names,
-    get_adapter_type_names,
-)
-from dbt.artifacts.resources import (
-    NodeConfig,
-    NodeVersion,
-    RefArgs,
-    SeedConfig,
-    SourceConfig,
-)
+from dbt.adapters.factory import get_adapter, get_adapter_type_names
+from dbt.artifacts.resources import DeferRelation, NodeVersion, RefArgs
 from dbt.clients.jinja import (
     MacroGenerator,
     MacroStack,
@@ -50,7 +47,7 @@ from dbt.context.context_config import ContextConfig
 from dbt.context.exceptions_jinja import wrapped_exports
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.macros import MacroNamespace, MacroNamespaceBuilder
-from dbt.context.manifest import ManifestContext
+from dbt.context.manifest import ManifestContext, get_internal_package_names
 from dbt.contracts.graph.manifest import Disabled, Manifest
 from dbt.contracts.graph.metrics import MetricReference, ResolvedMetricReference
 from dbt.contracts.graph.nodes import (
@@ -89,7 +86,7 @@ from dbt.exceptions import (
 from dbt.flags import get_flags
 from dbt.materializations.incremental.microbatch import MicrobatchBuilder
 from dbt.node_types import ModelLanguage, NodeType
-from dbt.utils import MultiDict, args_to_dict
+from dbt.utils import args_to_dict
 from dbt_common.clients.jinja import MacroProtocol
 from dbt_common.constants import SECRET_ENV_PREFIX
 from dbt_common.context import get_invocation_context
@@ -100,7 +97,7 @@ from dbt_common.exceptions import (
     DbtValidationError,
     MacrosSourcesUnWriteableError,
 )
-from dbt_common.utils import AttrDict, cast_to_str, merge
+from dbt_common.utils import AttrDict, cast_to_str
 
 if TYPE_CHECKING:
     import agate
@@ -108,18 +105,81 @@ if TYPE_CHECKING:
 
 _MISSING = object()
 
+# Model-kind tags, resolved once per resolver so the hot event-time-filter
+# path reads an int instead of re-running isinstance checks.
+_MODEL_KIND_OTHER = 0
+_MODEL_KIND_MODEL = 1
+_MODEL_KIND_SNAPSHOT = 2
+
+# resource types that never have pre/post hooks
+_NO_HOOK_TYPES = frozenset({NodeType.Source, NodeType.Test, NodeType.Unit})
+
+# Column.translate_type results keyed by Column class and original type;
+# contracted column data types repeat heavily across models
+_translated_type_cache: Dict[Tuple[type, str], str] = {}
+
+# shared empty agate table for stored results without row data; built on
+# first use and never mutated, so every store_result call can reuse it
+_empty_agate_table: Optional["agate.Table"] = None
+
+
+def _get_empty_agate_table() -> "agate.Table":
+    global _empty_agate_table
+    if _empty_agate_table is None:
+        from dbt_common.clients import agate_helper
+
+        _empty_agate_table = agate_helper.empty_table()
+    return _empty_agate_table
+
+
+# SELECTED_RESOURCES is a plain list that is rebound wholesale by
+# set_selected_resources; keep a frozenset view of the current list so ref
+# resolution does hash lookups instead of linear scans. The cache holds the
+# list object itself, so an identity check is enough to detect rebinding.
+_selected_resources_set_cache: Tuple[Optional[List[str]], frozenset] = (None, frozenset())
+
+
+def _get_selected_resources_set() -> frozenset:
+    global _selected_resources_set_cache
+    current = selected_resources.SELECTED_RESOURCES
+    cached_list, cached_set = _selected_resources_set_cache
+    if cached_list is not current:
+        cached_set = frozenset(current)
+        _selected_resources_set_cache = (current, cached_set)
+    return cached_set
+
+
+def _merge_quote_policy(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    # Quote policy values are flat primitives; a shallow copy-and-update is
+    # all merge() would do here, without the varargs recursion.
+    merged = dict(base)
+    merged.update(override)
+    return merged
+
 
 # base classes
 class RelationProxy:
+    __slots__ = ("_quoting_config", "_relation_type", "_default_quote_policy")
+
     def __init__(self, adapter):
         self._quoting_config = adapter.config.quoting
         self._relation_type = adapter.Relation
+        self._default_quote_policy: Optional[Dict[str, Any]] = None
 
     def __getattr__(self, key):
         return getattr(self._relation_type, key)
 
     def create(self, *args, **kwargs):
-        kwargs["quote_policy"] = merge(self._quoting_config, kwargs.pop("quote_policy", {}))
+        override = kwargs.pop("quote_policy", None)
+        if override:
+            kwargs["quote_policy"] = _merge_quote_policy(self._quoting_config, override)
+        else:
+            # Without an override the merge always produces the same dict, so
+            # build it once and share it; create() treats the policy as
+            # read-only.
+            if self._default_quote_policy is None:
+                self._default_quote_policy = dict(self._quoting_config)
+            kwargs["quote_policy"] = self._default_quote_policy
         return self._relation_type.create(*args, **kwargs)
 
 
@@ -131,12 +191,23 @@ class BaseDatabaseWrapper:
 
     def __init__(self, adapter, namespace: MacroNamespace):
         self._adapter = adapter
-        self.Relation = RelationProxy(adapter)
         self._namespace = namespace
+        self._adapter_macro_prefixes: Optional[List[str]] = None
+        # Pre-bind the adapter's available-method set so __getattr__ does a
+        # single O(1) membership test instead of chasing attribute chains.
+        self._available_set = frozenset(adapter._available_)
+        self._search_packages_cache: Dict[Optional[str], List[Optional[str]]] = {}
 
     def __getattr__(self, name):
         raise NotImplementedError("subclasses need to implement this")
 
+    @cached_property
+    def Relation(self) -> RelationProxy:
+        # Built lazily: a wrapper whose macros never touch adapter.Relation
+        # shouldn't pay for the proxy. cached_property stores the result in
+        # the instance dict, so later lookups skip the descriptor entirely.
+        return RelationProxy(self._adapter)
+
     @property
     def config(self):
         return self._adapter.config
@@ -148,14 +219,27 @@ class BaseDatabaseWrapper:
         return self._adapter.commit_if_has_connection()
 
     def _get_adapter_macro_prefixes(self) -> List[str]:
-        # order matters for dispatch:
-        #  1. current adapter
-        #  2. any parent adapters (dependencies)
-        #  3. 'default'
-        search_prefixes = get_adapter_type_names(self._adapter.type()) + ["default"]
-        return search_prefixes
+        # The adapter type does not change over the lifetime of the wrapper,
+        # so only compute the search prefixes once.
+        if self._adapter_macro_prefixes is None:
+            # order matters for dispatch:
+            #  1. current adapter
+            #  2. any parent adapters (dependencies)
+            #  3. 'default'
+            self._adapter_macro_prefixes = get_adapter_type_names(self._adapter.type()) + [
+                "default"
+            ]
+        return self._adapter_macro_prefixes
 
     def _get_search_packages(self, namespace: Optional[str] = None) -> List[Optional[str]]:
+        # dispatch calls this with a small set of namespaces many times per
+        # compile, and the result only depends on the namespace and the
+        # adapter config, so cache it per wrapper.
+        if namespace is None or isinstance(namespace, str):
+            cached = self._search_packages_cache.get(namespace)
+            if cached is not None:
+                return cached
+
         search_packages: List[Optional[str]] = [None]
 
         if namespace is None:
@@ -172,6 +256,7 @@ class BaseDatabaseWrapper:
                 f'("{namespace}"), but macro_namespace should be None or a string.'
             )
 
+        self._search_packages_cache[namespace] = search_packages
         return search_packages
 
     def dispatch(
@@ -197,11 +282,12 @@ class BaseDatabaseWrapper:
 
         search_packages = self._get_search_packages(macro_namespace)
 
-        attempts = []
+        # macro_name and the prefixes are fixed for the whole search, so
+        # build each candidate name exactly once rather than per package.
+        search_names = [f"{prefix}__{macro_name}" for prefix in self._get_adapter_macro_prefixes()]
 
         for package_name in search_packages:
-            for prefix in self._get_adapter_macro_prefixes():
-                search_name = f"{prefix}__{macro_name}"
+            for search_name in search_names:
                 try:
                     # this uses the namespace from the context
                     macro = self._namespace.get_from_package(package_name, search_name)
@@ -210,30 +296,107 @@ class BaseDatabaseWrapper:
                     # any package
                     macro = None
 
+                if macro is not None:
+                    return macro
+
+        # Only reconstruct the attempted search names if the whole search
+        # failed: the successful (and far more common) path doesn't need them.
+        self._raise_dispatch_error(macro_name, macro_namespace, search_packages, search_names)
+
+    def _raise_dispatch_error(
+        self,
+        macro_name: str,
+        macro_namespace: Optional[str],
+        search_packages: List[Optional[str]],
+        search_names: List[str],
+    ) -> NoReturn:
+        attempts = []
+        for package_name in search_packages:
+            for search_name in search_names:
                 if package_name is None:
                     attempts.append(search_name)
                 else:
                     attempts.append(f"{package_name}.{search_name}")
 
-                if macro is not None:
-                    return macro
-
         searched = ", ".join(repr(a) for a in attempts)
         msg = f"In dispatch: No macro named '{macro_name}' found within namespace: '{macro_namespace}'\n    Searched for: {searched}"
         raise CompilationError(msg)
 
 
 class BaseResolver(metaclass=abc.ABCMeta):
+    # resolvers are instantiated for every model (and often every call);
+    # slots keep them small and make the hot attribute reads C-level
+    __slots__ = (
+        "db_wrapper",
+        "model",
+        "config",
+        "manifest",
+        "_event_time_filter_cache",
+        "_adapter_instance",
+        "_target_relation_cache",
+        "_sample_mode",
+        "_sample_start",
+        "_sample_end",
+        "_model_kind",
+        "_is_microbatch_model",
+    )
+
     def __init__(self, db_wrapper, model, config, manifest):
         self.db_wrapper = db_wrapper
         self.model = model
         self.config = config
         self.manifest = manifest
+        # The event time filter for a target is fully determined by state
+        # that does not change over the resolver's lifetime (the target's
+        # event_time config, this model's batch, and the sample window), so
+        # cache it per target.
+        self._event_time_filter_cache: Dict[str, Optional[EventTimeFilter]] = {}
+        self._adapter_instance = None
+        self._target_relation_cache: Dict[Tuple[Optional[str], str, str], Any] = {}
+        # Sample state, computed once on first use (None means "not yet
+        # computed"; after that _sample_mode is a plain bool).
+        self._sample_mode: Optional[bool] = None
+        self._sample_start = None
+        self._sample_end = None
+        # Model-kind tag and microbatch flag, resolved on first use since
+        # the model's type and config are invariant per resolver.
+        self._model_kind: Optional[int] = None
+        self._is_microbatch_model: Optional[bool] = None
 
     @property
     def current_project(self):
         return self.config.project_name
 
+    def _get_model_kind(self) -> int:
+        kind = self._model_kind
+        if kind is None:
+            if isinstance(self.model, ModelNode):
+                kind = _MODEL_KIND_MODEL
+            elif isinstance(self.model, SnapshotNode):
+                kind = _MODEL_KIND_SNAPSHOT
+            else:
+                kind = _MODEL_KIND_OTHER
+            self._model_kind = kind
+        return kind
+
+    def _get_is_microbatch_model(self) -> bool:
+        is_microbatch = self._is_microbatch_model
+        if is_microbatch is None:
+            is_microbatch = (
+                self._get_model_kind() == _MODEL_KIND_MODEL
+                and self.model.config.materialized == "incremental"
+                and self.model.config.incremental_strategy == "microbatch"
+            )
+            self._is_microbatch_model = is_microbatch
+        return is_microbatch
+
+    def _get_adapter(self):
+        # get_adapter is a factory lookup; resolvers are hot enough that it's
+        # worth doing only once per instance.
+        if self._adapter_instance is None:
+            self._adapter_instance = get_adapter(self.config)
+        return self._adapter_instance
+
     @property
     def Relation(self):
         return self.db_wrapper.Relation
@@ -242,6 +405,12 @@ class BaseResolver(metaclass=abc.ABCMeta):
     def resolve_limit(self) -> Optional[int]:
         return 0 if getattr(self.config.args, "EMPTY", False) else None
 
+    @staticmethod
+    def _resolve_target_column_quote(target: ManifestNode) -> Optional[bool]:
+        """Get the target-level column quote setting, if one is configured."""
+        quoting = getattr(target, "quoting", None)
+        return getattr(quoting, "column", None) if quoting is not None else None
+
     def _resolve_event_time_field_name(self, target: ManifestNode) -> str:
         """Get the event time field name with proper quoting based on configuration."""
         # Default to False for quoting
@@ -250,82 +419,91 @@ class BaseResolver(metaclass=abc.ABCMeta):
         column = None
 
         # Check if config has event_time attribute
-        if not hasattr(target.config, "event_time") or target.config.event_time is None:
+        event_time = getattr(target.config, "event_time", None)
+        if event_time is None:
             return ""
 
         # Check column-level quote configuration first (overrides source-level)
-        if hasattr(target, "columns") and target.columns and isinstance(target.columns, dict):
-            for _, column_info in target.columns.items():
-                if column_info.name == target.config.event_time:
-                    column_found = True
-                    # Create the column object
-                    column = Column.create(
-                        column_info.name, column_info.data_type if column_info.data_type else ""
-                    )
-                    # Column-level quote setting takes precedence
-                    if hasattr(column_info, "quote") and column_info.quote is not None:
-                        should_quote = column_info.quote
-                    # Fallback to source-level quote setting
-                    elif (
-                        hasattr(target, "quoting")
-                        and hasattr(target.quoting, "column")
-                        and target.quoting.column is not None
-                    ):
-                        should_quote = target.quoting.column
-                    break
+        columns = getattr(target, "columns", None)
+        if columns and isinstance(columns, dict):
+            # Columns are keyed by name in the common case, so try a direct
+            # lookup before falling back to a scan (the key can differ from
+            # the column's .name).
+            column_info = columns.get(event_time)
+            if column_info is not None and column_info.name != event_time:
+                column_info = None
+            if column_info is None:
+                column_info = next(
+                    (ci for ci in columns.values() if ci.name == event_time),
+                    None,
+                )
+            if column_info is not None:
+                column_found = True
+                # Create the column object
+                column = Column.create(
+                    column_info.name, column_info.data_type if column_info.data_type else ""
+                )
+                # Column-level quote setting takes precedence
+                column_quote = getattr(column_info, "quote", None)
+                if column_quote is not None:
+                    should_quote = column_quote
+                # Fallback to source-level quote setting
+                else:
+                    target_quote = self._resolve_target_column_quote(target)
+                    if target_quote is not None:
+                        should_quote = target_quote
 
         # If column not found, fall back to source-level quote setting
         if not column_found:
-            if (
-                hasattr(target, "quoting")
-                and hasattr(target.quoting, "column")
-                and target.quoting.column is not None
-            ):
-                should_quote = target.quoting.column
+            target_quote = self._resolve_target_column_quote(target)
+            if target_quote is not None:
+                should_quote = target_quote
             # Create column object for quoting
-            column = Column.create(target.config.event_time, "")
+            column = Column.create(event_time, "")
 
         # Apply quoting logic
         if should_quote and column is not None:
             return column.quoted
         else:
-            return target.config.event_time
+            return event_time
 
     def resolve_event_time_filter(self, target: ManifestNode) -> Optional[EventTimeFilter]:
+        cache_key = target.unique_id
+        if cache_key in self._event_time_filter_cache:
+            return self._event_time_filter_cache[cache_key]
+
         event_time_filter = None
-        sample_mode = getattr(self.config.args, "sample", None) is not None
+        if self._sample_mode is None:
+            # The sample window doesn't change over the resolver's lifetime,
+            # so resolve the arg chain once.
+            sample = getattr(self.config.args, "sample", None)
+            self._sample_mode = sample is not None
+            self._sample_start = sample.start if sample else None
+            self._sample_end = sample.end if sample else None
+        sample_mode = self._sample_mode
         field_name = self._resolve_event_time_field_name(target)
 
         # TODO The number of branches here is getting rough. We should consider ways to simplify
         # what is going on to make it easier to maintain
 
-        # Only do event time filtering if the base node has the necessary event time configs
+        # Only do event time filtering if the base node has the necessary event
+        # time configs. Only node and source configs carry event_time, so the
+        # attribute check doubles as the config-type check.
         if (
-            isinstance(target.config, (NodeConfig, SeedConfig, SourceConfig))
-            and target.config.event_time
-            and isinstance(self.model, (ModelNode, SnapshotNode))
+            getattr(target.config, "event_time", None)
+            and self._get_model_kind() != _MODEL_KIND_OTHER
         ):
 
             # Handling of microbatch models
             if (
-                isinstance(self.model, ModelNode)
-                and self.model.config.materialized == "incremental"
-                and self.model.config.incremental_strategy == "microbatch"
+                self._get_is_microbatch_model()
                 and self.manifest.use_microbatch_batches(project_name=self.config.project_name)
                 and self.model.batch is not None
             ):
                 # Sample mode microbatch models
                 if sample_mode:
-                    start = (
-                        self.config.args.sample.start
-                        if self.config.args.sample.start > self.model.batch.event_time_start
-                        else self.model.batch.event_time_start
-                    )
-                    end = (
-                        self.config.args.sample.end
-                        if self.config.args.sample.end < self.model.batch.event_time_end
-                        else self.model.batch.event_time_end
-                    )
+                    start = max(self._sample_start, self.model.batch.event_time_start)
+                    end = min(self._sample_end, self.model.batch.event_time_end)
                     event_time_filter = EventTimeFilter(
                         field_name=field_name,
                         start=start,
@@ -344,10 +522,11 @@ class BaseResolver(metaclass=abc.ABCMeta):
             elif sample_mode:
                 event_time_filter = EventTimeFilter(
                     field_name=field_name,
-                    start=self.config.args.sample.start,
-                    end=self.config.args.sample.end,
+                    start=self._sample_start,
+                    end=self._sample_end,
                 )
 
+        self._event_time_filter_cache[cache_key] = event_time_filter
         return event_time_filter
 
     @abc.abstractmethod
@@ -356,6 +535,8 @@ class BaseResolver(metaclass=abc.ABCMeta):
 
 
 class BaseRefResolver(BaseResolver):
+    __slots__ = ()
+
     @abc.abstractmethod
     def resolve(
         self, name: str, package: Optional[str] = None, version: Optional[NodeVersion] = None
@@ -364,7 +545,7 @@ class BaseRefResolver(BaseResolver):
     def _repack_args(
         self, name: str, package: Optional[str], version: Optional[NodeVersion]
     ) -> RefArgs:
-        return RefArgs(package=package, name=name, version=version)
+        return RefArgs(name, package, version)
 
     def validate_args(self, name: str, package: Optional[str], version: Optional[NodeVersion]):
         if not isinstance(name, str):
@@ -400,6 +581,8 @@ class BaseRefResolver(BaseResolver):
 
 
 class BaseSourceResolver(BaseResolver):
+    __slots__ = ()
+
     @abc.abstractmethod
     def resolve(self, source_name: str, table_name: str):
         pass
@@ -424,6 +607,8 @@ class BaseSourceResolver(BaseResolver):
 
 
 class BaseMetricResolver(BaseResolver):
+    __slots__ = ()
+
     @abc.abstractmethod
     def resolve(self, name: str, package: Optional[str] = None) -> MetricReference: ...
 
@@ -464,17 +649,23 @@ class Config(Protocol):
 
 # Implementation of "config(..)" calls in models
 class ParseConfigObject(Config):
+    __slots__ = ("model", "context_config", "_unrendered_config")
+
     def __init__(self, model, context_config: Optional[ContextConfig]):
         self.model = model
         self.context_config = context_config
+        self._unrendered_config: Any = _MISSING
 
     def _transform_config(self, config):
-        for oldkey in ("pre_hook", "post_hook"):
-            if oldkey in config:
-                newkey = oldkey.replace("_", "-")
-                if newkey in config:
-                    raise ConflictingConfigKeysError(oldkey, newkey, node=self.model)
-                config[newkey] = config.pop(oldkey)
+        # most configs never use the legacy hook keys; skip the rename loop
+        # entirely unless one is present
+        if "pre_hook" in config or "post_hook" in config:
+            for oldkey in ("pre_hook", "post_hook"):
+                if oldkey in config:
+                    newkey = oldkey.replace("_", "-")
+                    if newkey in config:
+                        raise ConflictingConfigKeysError(oldkey, newkey, node=self.model)
+                    config[newkey] = config.pop(oldkey)
         return config
 
     def __call__(self, *args, **kwargs):
@@ -492,11 +683,14 @@ class ParseConfigObject(Config):
         if self.context_config is None:
             raise DbtRuntimeError("At parse time, did not receive a context config")
 
-        # Track unrendered opts to build parsed node unrendered_config later on
+        # Track unrendered opts to build parsed node unrendered_config later on.
+        # raw_code doesn't change between config() calls in a model, so only
+        # statically parse (and record) it once per model.
         if get_flags().state_modified_compare_more_unrendered_values:
-            unrendered_config = statically_parse_unrendered_config(self.model.raw_code)
-            if unrendered_config:
-                self.context_config.add_unrendered_config_call(unrendered_config)
+            if self._unrendered_config is _MISSING:
+                self._unrendered_config = statically_parse_unrendered_config(self.model.raw_code)
+                if self._unrendered_config:
+                    self.context_config.add_unrendered_config_call(self._unrendered_config)
 
         # Use rendered opts to populate context_config
         self.context_config.add_config_call(opts)
@@ -519,8 +713,11 @@ class ParseConfigObject(Config):
 
 
 class RuntimeConfigObject(Config):
+    __slots__ = ("model", "_persist_docs")
+
     def __init__(self, model, context_config: Optional[ContextConfig] = None):
         self.model = model
+        self._persist_docs: Optional[Dict[str, Any]] = None
         # we never use or get a config, only the parser cares
 
     def __call__(self, *args, **kwargs):
@@ -534,10 +731,10 @@ class RuntimeConfigObject(Config):
 
     def _lookup(self, name, default=_MISSING):
         # if this is a macro, there might be no `model.config`.
-        if not hasattr(self.model, "config"):
-            result = default
-        else:
+        try:
             result = self.model.config.get(name, default)
+        except AttributeError:
+            result = default
         if result is _MISSING:
             raise MissingConfigError(unique_id=self.model.unique_id, name=name)
         return result
@@ -558,19 +755,21 @@ class RuntimeConfigObject(Config):
 
         return to_return
 
-    def persist_relation_docs(self) -> bool:
-        persist_docs = self.get("persist_docs", default={})
-        if not isinstance(persist_docs, dict):
-            raise PersistDocsValueTypeError(persist_docs)
+    def _get_persist_docs(self) -> Dict[str, Any]:
+        # invariant per model, so only look it up (and validate it) once
+        if self._persist_docs is None:
+            persist_docs = self.get("persist_docs", default={})
+            if not isinstance(persist_docs, dict):
+                raise PersistDocsValueTypeError(persist_docs)
+            self._persist_docs = persist_docs
 
-        return persist_docs.get("relation", False)
+        return self._persist_docs
 
-    def persist_column_docs(self) -> bool:
-        persist_docs = self.get("persist_docs", default={})
-        if not isinstance(persist_docs, dict):
-            raise PersistDocsValueTypeError(persist_docs)
+    def persist_relation_docs(self) -> bool:
+        return self._get_persist_docs().get("relation", False)
 
-        return persist_docs.get("columns", False)
+    def persist_column_docs(self) -> bool:
+        return self._get_persist_docs().get("columns", False)
 
 
 # `adapter` implementations
@@ -580,12 +779,13 @@ class ParseDatabaseWrapper(BaseDatabaseWrapper):
     """
 
     def __getattr__(self, name):
-        override = name in self._adapter._available_ and name in self._adapter._parse_replacements_
-
-        if override:
-            return self._adapter._parse_replacements_[name]
-        elif name in self._adapter._available_:
-            return getattr(self._adapter, name)
+        if name in self._available_set:
+            override = self._adapter._parse_replacements_.get(name)
+            value = override if override is not None else getattr(self._adapter, name)
+            # Cache the resolved attribute so later accesses hit the instance
+            # dict directly and never re-enter __getattr__.
+            self.__dict__[name] = value
+            return value
         else:
             raise AttributeError(
                 "'{}' object has no attribute '{}'".format(self.__class__.__name__, name)
@@ -598,8 +798,12 @@ class RuntimeDatabaseWrapper(BaseDatabaseWrapper):
     """
 
     def __getattr__(self, name):
-        if name in self._adapter._available_:
-            return getattr(self._adapter, name)
+        if name in self._available_set:
+            value = getattr(self._adapter, name)
+            # Cache the resolved attribute so later accesses hit the instance
+            # dict directly and never re-enter __getattr__.
+            self.__dict__[name] = value
+            return value
         else:
             raise AttributeError(
                 "'{}' object has no attribute '{}'".format(self.__class__.__name__, name)
@@ -608,6 +812,8 @@ class RuntimeDatabaseWrapper(BaseDatabaseWrapper):
 
 # `ref` implementations
 class ParseRefResolver(BaseRefResolver):
+    __slots__ = ()
+
     def resolve(
         self, name: str, package: Optional[str] = None, version: Optional[NodeVersion] = None
     ) -> RelationProxy:
@@ -621,6 +827,8 @@ ResolveRef = Union[Disabled, ManifestNode]
 
 
 class RuntimeRefResolver(BaseRefResolver):
+    __slots__ = ()
+
     def resolve(
         self,
         target_name: str,
@@ -671,42 +879,48 @@ class RuntimeRefResolver(BaseRefResolver):
         return self.create_relation(target_model)
 
     def create_relation(self, target_model: ManifestNode) -> RelationProxy:
+        limit = self.resolve_limit
+        event_time_filter = self.resolve_event_time_filter(target_model)
+
         if target_model.is_ephemeral_model:
             self.model.set_cte(target_model.unique_id, None)
             return self.Relation.create_ephemeral_from(
                 target_model,
-                limit=self.resolve_limit,
-                event_time_filter=self.resolve_event_time_filter(target_model),
+                limit=limit,
+                event_time_filter=event_time_filter,
             )
-        elif (
-            hasattr(target_model, "defer_relation")
+
+        target: Union[ManifestNode, DeferRelation] = target_model
+        if (
+            self.config.args.defer
+            and hasattr(target_model, "defer_relation")
             and target_model.defer_relation
-            and self.config.args.defer
             and (
                 # User has explicitly opted to prefer defer_relation for unselected resources
                 (
                     self.config.args.favor_state
-                    and target_model.unique_id not in selected_resources.SELECTED_RESOURCES
+                    and target_model.unique_id not in _get_selected_resources_set()
                 )
                 # Or, this node's relation does not exist in the expected target location (cache lookup)
-                or not get_adapter(self.config).get_relation(
-                    target_model.database, target_model.schema, target_model.identifier
-                )
+                or not self._get_target_relation(target_model)
             )
         ):
-            return self.Relation.create_from(
-                self.config,
-                target_model.defer_relation,
-                limit=self.resolve_limit,
-                event_time_filter=self.resolve_event_time_filter(target_model),
-            )
-        else:
-            return self.Relation.create_from(
-                self.config,
-                target_model,
-                limit=self.resolve_limit,
-                event_time_filter=self.resolve_event_time_filter(target_model),
-            )
+            target = target_model.defer_relation
+
+        return self.Relation.create_from(
+            self.config,
+            target,
+            limit=limit,
+            event_time_filter=event_time_filter,
+        )
+
+    def _get_target_relation(self, target_model: ManifestNode):
+        # Memoize the adapter cache probe per resolved location for the
+        # duration of this model's compile.
+        key = (target_model.database, target_model.schema, target_model.identifier)
+        if key not in self._target_relation_cache:
+            self._target_relation_cache[key] = self._get_adapter().get_relation(*key)
+        return self._target_relation_cache[key]
 
     def validate(
         self,
@@ -721,6 +935,8 @@ class RuntimeRefResolver(BaseRefResolver):
 
 
 class OperationRefResolver(RuntimeRefResolver):
+    __slots__ = ()
+
     def validate(
         self,
         resolved: ManifestNode,
@@ -740,6 +956,8 @@ class OperationRefResolver(RuntimeRefResolver):
 
 
 class RuntimeUnitTestRefResolver(RuntimeRefResolver):
+    __slots__ = ()
+
     @property
     def resolve_limit(self) -> Optional[int]:
         # Unit tests should never respect --empty flag or provide a limit since they are based on fake data.
@@ -756,13 +974,27 @@ class RuntimeUnitTestRefResolver(RuntimeRefResolver):
 
 # `source` implementations
 class ParseSourceResolver(BaseSourceResolver):
+    __slots__ = ()
+
     def resolve(self, source_name: str, table_name: str):
         # When you call source(), this is what happens at parse time
         self.model.sources.append([source_name, table_name])
         return self.Relation.create_from(self.config, self.model)
 
 
+# Source quoting does _not_ respect global configs in dbt_project.yml, as documented here:
+# https://docs.getdbt.com/reference/project-configs/quoting
+# Use an object with an empty quoting field to bypass any settings on the resolver's config.
+class SourceQuotingBaseConfig:
+    quoting: Dict[str, Any] = {}
+
+
+_SOURCE_QUOTING_BASE_CONFIG = SourceQuotingBaseConfig()
+
+
 class RuntimeSourceResolver(BaseSourceResolver):
+    __slots__ = ()
+
     def resolve(self, source_name: str, table_name: str):
         target_source = self.manifest.resolve_source(
             source_name,
@@ -779,14 +1011,8 @@ class RuntimeSourceResolver(BaseSourceResolver):
                 disabled=(isinstance(target_source, Disabled)),
             )
 
-        # Source quoting does _not_ respect global configs in dbt_project.yml, as documented here:
-        # https://docs.getdbt.com/reference/project-configs/quoting
-        # Use an object with an empty quoting field to bypass any settings in self.
-        class SourceQuotingBaseConfig:
-            quoting: Dict[str, Any] = {}
-
         return self.Relation.create_from(
-            SourceQuotingBaseConfig(),
+            _SOURCE_QUOTING_BASE_CONFIG,
             target_source,
             limit=self.resolve_limit,
             event_time_filter=self.resolve_event_time_filter(target_source),
@@ -794,6 +1020,8 @@ class RuntimeSourceResolver(BaseSourceResolver):
 
 
 class RuntimeUnitTestSourceResolver(BaseSourceResolver):
+    __slots__ = ()
+
     @property
     def resolve_limit(self) -> Optional[int]:
         # Unit tests should never respect --empty flag or provide a limit since they are based on fake data.
@@ -823,6 +1051,8 @@ class RuntimeUnitTestSourceResolver(BaseSourceResolver):
 
 # metric` implementations
 class ParseMetricResolver(BaseMetricResolver):
+    __slots__ = ()
+
     def resolve(self, name: str, package: Optional[str] = None) -> MetricReference:
         self.model.metrics.append(self._repack_args(name, package))
 
@@ -830,6 +1060,8 @@ class ParseMetricResolver(BaseMetricResolver):
 
 
 class RuntimeMetricResolver(BaseMetricResolver):
+    __slots__ = ()
+
     def resolve(self, target_name: str, target_package: Optional[str] = None) -> MetricReference:
         target_metric = self.manifest.resolve_metric(
             target_name,
@@ -859,31 +1091,43 @@ class ModelConfiguredVar(Var):
     ) -> None:
         self._node: Resource
         self._config: RuntimeConfig = config
+        # set before super().__init__, which builds the merged var mapping;
+        # the node and config are fixed per Var, so resolve the search node
+        # and adapter type here instead of inside _generate_merged
+        self._packages_for_node: Optional[Tuple[Project, ...]] = None
+        self._search_node: IsFQNResource = (
+            node if isinstance(node, IsFQNResource) else FQNLookup(node.package_name)
+        )
+        self._adapter_type: str = config.credentials.type
         super().__init__(context, config.cli_vars, node=node)
 
-    def packages_for_node(self) -> Iterable[Project]:
-        dependencies = self._config.load_dependencies()
-        package_name = self._node.package_name
+    def packages_for_node(self) -> Sequence[Project]:
+        # The node and config are fixed per Var, so resolve the dependency
+        # walk once and hand back the materialized tuple afterwards.
+        if self._packages_for_node is None:
+            dependencies = self._config.load_dependencies()
+            package_name = self._node.package_name
 
-        if package_name != self._config.project_name:
-            if package_name in dependencies:
-                yield dependencies[package_name]
-        yield self._config
+            packages = []
+            if package_name != self._config.project_name and package_name in dependencies:
+                packages.append(dependencies[package_name])
+            packages.append(self._config)
+            self._packages_for_node = tuple(packages)
+        return self._packages_for_node
 
     def _generate_merged(self) -> Mapping[str, Any]:
-        search_node: IsFQNResource
-        if isinstance(self._node, IsFQNResource):
-            search_node = self._node
-        else:
-            search_node = FQNLookup(self._node.package_name)
-
-        adapter_type = self._config.credentials.type
+        search_node = self._search_node
+        adapter_type = self._adapter_type
 
-        merged = MultiDict()
-        for project in self.packages_for_node():
-            merged.add(project.vars.vars_for(search_node, adapter_type))
-        merged.add(self._cli_vars)
-        return merged
+        # Layer the per-package var mappings in a ChainMap instead of eagerly
+        # merging them: most templates only look up a handful of vars, so
+        # copying every entry up front is wasted work. ChainMap resolves
+        # first-hit, so the layers are stacked in reverse priority order of
+        # the old merge (cli vars on top, then packages latest-first).
+        layers: List[Mapping[str, Any]] = [self._cli_vars]
+        for project in reversed(self.packages_for_node()):
+            layers.append(project.vars.vars_for(search_node, adapter_type))
+        return ChainMap(*layers)  # type: ignore[arg-type]
 
 
 class ParseVar(ModelConfiguredVar):
@@ -896,6 +1140,19 @@ class RuntimeVar(ModelConfiguredVar):
     pass
 
 
+def _clone_config_with_vars(config: RuntimeConfig, extra_vars: Mapping[str, Any]) -> RuntimeConfig:
+    """Return a copy of ``config`` with ``extra_vars`` layered over its cli_vars.
+
+    A shallow copy is enough: cli_vars is the only attribute the Var code
+    path touches, and rebinding it to a merged dict leaves the original
+    config (and everything it references) untouched. deepcopy would walk
+    the entire RuntimeConfig graph per clone.
+    """
+    config_copy = copy(config)
+    config_copy.cli_vars = {**config.cli_vars, **extra_vars}
+    return config_copy
+
+
 class UnitTestVar(RuntimeVar):
     def __init__(
         self,
@@ -903,13 +1160,11 @@ class UnitTestVar(RuntimeVar):
         config: RuntimeConfig,
         node: Resource,
     ) -> None:
-        config_copy = None
         assert isinstance(node, UnitTestNode)
         if node.overrides and node.overrides.vars:
-            config_copy = deepcopy(config)
-            config_copy.cli_vars.update(node.overrides.vars)
+            config = _clone_config_with_vars(config, node.overrides.vars)
 
-        super().__init__(context, config_copy or config, node=node)
+        super().__init__(context, config, node=node)
 
 
 # Providers
@@ -924,6 +1179,8 @@ class Provider(Protocol):
 
 
 class ParseProvider(Provider):
+    __slots__ = ()
+
     execute = False
     Config = ParseConfigObject
     DatabaseWrapper = ParseDatabaseWrapper
@@ -934,6 +1191,8 @@ class ParseProvider(Provider):
 
 
 class GenerateNameProvider(Provider):
+    __slots__ = ()
+
     execute = False
     Config = RuntimeConfigObject
     DatabaseWrapper = ParseDatabaseWrapper
@@ -944,6 +1203,8 @@ class GenerateNameProvider(Provider):
 
 
 class RuntimeProvider(Provider):
+    __slots__ = ()
+
     execute = True
     Config = RuntimeConfigObject
     DatabaseWrapper = RuntimeDatabaseWrapper
@@ -954,6 +1215,8 @@ class RuntimeProvider(Provider):
 
 
 class RuntimeUnitTestProvider(Provider):
+    __slots__ = ()
+
     execute = True
     Config = RuntimeConfigObject
     DatabaseWrapper = RuntimeDatabaseWrapper
@@ -964,11 +1227,65 @@ class RuntimeUnitTestProvider(Provider):
 
 
 class OperationProvider(RuntimeProvider):
+    __slots__ = ()
+
     ref = OperationRefResolver
 
 
+# Providers are stateless namespaces of classes, so each kind only needs to
+# exist once; the generate_* entrypoints below share these instances instead
+# of allocating a provider per context.
+_PARSE_PROVIDER = ParseProvider()
+_GENERATE_NAME_PROVIDER = GenerateNameProvider()
+_RUNTIME_PROVIDER = RuntimeProvider()
+_RUNTIME_UNIT_TEST_PROVIDER = RuntimeUnitTestProvider()
+_OPERATION_PROVIDER = OperationProvider()
+
+
 T = TypeVar("T")
 
+# Seed tables parsed during this invocation, keyed by path, mtime, and the
+# parse-relevant seed config. Repeated load_agate_table() calls for the same
+# unchanged seed reuse the parsed table instead of re-reading the CSV.
+_agate_table_cache: Dict[Tuple[Any, ...], "agate.Table"] = {}
+
+
+class _LazyStoredResult(AttrDict):
+    """A stored query result whose ``data`` matrix is built lazily.
+
+    ``as_matrix`` copies the whole agate table into a list of row lists, but
+    most macros only ever read ``response`` or ``table``, so defer that work
+    until ``data`` is actually accessed.
+    """
+
+    def __missing__(self, key):
+        if key == "data":
+            from dbt_common.clients import agate_helper
+
+            data = self["data"] = agate_helper.as_matrix(self["table"])
+            return data
+        raise KeyError(key)
+
+    def __getattr__(self, name):
+        # AttrDict aliases __dict__ to the dict itself, so only keys that are
+        # not yet present land here; route them through __missing__.
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def get(self, key, default=None):
+        # dict.get doesn't consult __missing__, so route through
+        # __getitem__ to keep result.get('data') working
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        # 'data' is always present, it just may not be built yet
+        return key == "data" or super().__contains__(key)
+
 
 # Base context collection, used for parsing configs.
 class ProviderContext(ManifestContext):
@@ -990,6 +1307,22 @@ class ProviderContext(ManifestContext):
         self.sql_results: Dict[str, Optional[AttrDict]] = {}
         self.context_config: Optional[ContextConfig] = context_config
         self.provider: Provider = provider
+        # If the model is already compiled, env_var() should not record
+        # anything because it's irrelevant to parsing. The flag is fixed for
+        # the lifetime of a context, so check it once here.
+        self._compiling: bool = getattr(model, "compiled", False) is True
+        # env vars already recorded in the manifest by this context; repeated
+        # env_var() calls for the same variable skip the manifest mutation
+        self._recorded_env_vars: Set[str] = set()
+        # precompute what write() needs: macros/source defs aren't
+        # 'writeable', and the incremental strategy is fixed per node
+        self._is_writable: bool = not isinstance(model, (Macro, SourceDefinition))
+        self._is_microbatch_strategy: bool = (
+            isinstance(model, ModelNode)
+            and model.config.get("incremental_strategy") == "microbatch"
+        )
+        # target write paths resolved by write(), keyed by split suffix
+        self._write_paths: Dict[Optional[str], str] = {}
         self.adapter = get_adapter(self.config)
         # The macro namespace is used in creating the DatabaseWrapper
         self.db_wrapper = self.provider.DatabaseWrapper(self.adapter, self.namespace)
@@ -997,7 +1330,7 @@ class ProviderContext(ManifestContext):
     # This overrides the method in ManifestContext, and provides
     # a model, which the ManifestContext builder does not
     def _get_namespace_builder(self):
-        internal_packages = get_adapter_package_names(self.config.credentials.type)
+        internal_packages = get_internal_package_names(self.config.credentials.type)
         return MacroNamespaceBuilder(
             self.config.project_name,
             self.search_package,
@@ -1020,38 +1353,37 @@ class ProviderContext(ManifestContext):
 
     @contextmember()
     def load_result(self, name: str) -> Optional[AttrDict]:
-        if name in self.sql_results:
-            # handle the special case of "main" macro
-            # See: https://github.com/dbt-labs/dbt-core/blob/ada8860e48b32ac712d92e8b0977b2c3c9749981/core/dbt/task/run.py#L228
-            if name == "main":
-                return self.sql_results["main"]
+        # Handle trying to load a result that was never stored
+        raw_val = self.sql_results.get(name, _MISSING)
+        if raw_val is _MISSING:
+            return None
+        # the sentinel widened the lookup to object; anything stored is an
+        # Optional[AttrDict]
+        ret_val = cast(Optional[AttrDict], raw_val)
 
-            # handle a None, which indicates this name was populated but has since been loaded
-            elif self.sql_results[name] is None:
-                raise MacroResultAlreadyLoadedError(name)
+        # handle the special case of "main" macro
+        # See: https://github.com/dbt-labs/dbt-core/blob/ada8860e48b32ac712d92e8b0977b2c3c9749981/core/dbt/task/run.py#L228
+        if name == "main":
+            return ret_val
 
-            # Handle the regular use case
-            else:
-                ret_val = self.sql_results[name]
-                self.sql_results[name] = None
-                return ret_val
-        else:
-            # Handle trying to load a result that was never stored
-            return None
+        # handle a None, which indicates this name was populated but has since been loaded
+        if ret_val is None:
+            raise MacroResultAlreadyLoadedError(name)
+
+        # Handle the regular use case
+        self.sql_results[name] = None
+        return ret_val
 
     @contextmember()
     def store_result(
         self, name: str, response: Any, agate_table: Optional["agate.Table"] = None
     ) -> str:
-        from dbt_common.clients import agate_helper
-
         if agate_table is None:
-            agate_table = agate_helper.empty_table()
+            agate_table = _get_empty_agate_table()
 
-        self.sql_results[name] = AttrDict(
+        self.sql_results[name] = _LazyStoredResult(
             {
                 "response": response,
-                "data": agate_helper.as_matrix(agate_table),
                 "table": agate_table,
             }
         )
@@ -1072,12 +1404,13 @@ class ProviderContext(ManifestContext):
     @contextproperty()
     def validation(self):
         def validate_any(*args) -> Callable[[T], None]:
+            # split out the type args once so inner() does a single isinstance
+            # check instead of scanning args on every call
+            arg_types = tuple(arg for arg in args if isinstance(arg, type))
+
             def inner(value: T) -> None:
-                for arg in args:
-                    if isinstance(arg, type) and isinstance(value, arg):
-                        return
-                    elif value == arg:
-                        return
+                if isinstance(value, arg_types) or value in args:
+                    return
                 raise DbtValidationError(
                     'Expected value "{}" to be one of {}'.format(value, ",".join(map(str, args)))
                 )
@@ -1092,25 +1425,32 @@ class ProviderContext(ManifestContext):
 
     @contextmember()
     def write(self, payload: str) -> str:
-        # macros/source defs aren't 'writeable'.
-        if isinstance(self.model, (Macro, SourceDefinition)):
+        if not self._is_writable:
             raise MacrosSourcesUnWriteableError(node=self.model)
+        # _is_writable has already excluded macros and source definitions
+        model = cast(ManifestNode, self.model)
 
         split_suffix = None
-        if (
-            isinstance(self.model, ModelNode)
-            and self.model.config.get("incremental_strategy") == "microbatch"
-            and self.model.batch is not None
-        ):
-            split_suffix = MicrobatchBuilder.format_batch_start(
-                self.model.batch.event_time_start,
-                self.model.config.batch_size,
-            )
+        # the batch is assigned per execution, so check it here rather than
+        # alongside the precomputed strategy flag
+        if self._is_microbatch_strategy:
+            model_node = cast(ModelNode, model)
+            if model_node.batch is not None:
+                split_suffix = MicrobatchBuilder.format_batch_start(
+                    model_node.batch.event_time_start,
+                    model_node.config.batch_size,
+                )
 
-        self.model.build_path = self.model.get_target_write_path(
-            self.config.target_path, "run", split_suffix=split_suffix
-        )
-        self.model.write_node(self.config.project_root, self.model.build_path, payload)
+        # repeated write() calls for the same batch resolve to the same path,
+        # so only run the join/suffix logic once per suffix
+        build_path = self._write_paths.get(split_suffix)
+        if build_path is None:
+            build_path = model.get_target_write_path(
+                self.config.target_path, "run", split_suffix=split_suffix
+            )
+            self._write_paths[split_suffix] = build_path
+        model.build_path = build_path
+        model.write_node(self.config.project_root, build_path, payload)
         return ""
 
     @contextmember()
@@ -1126,6 +1466,28 @@ class ProviderContext(ManifestContext):
         except Exception:
             raise CompilationError(message_if_exception, self.model)
 
+    def _get_agate_table_path(self) -> str:
+        # The resolved seed path is invariant per context, so only pay for
+        # the joins and the existence check once.
+        path = self.__dict__.get("_agate_table_path")
+        if path is None:
+            # load_agate_table has already checked the node type
+            assert isinstance(self.model, SeedNode)
+            # include package_path for seeds defined in packages
+            package_path = (
+                os.path.join(self.config.packages_install_path, self.model.package_name)
+                if self.model.package_name != self.config.project_name
+                else "."
+            )
+            path = os.path.join(
+                self.config.project_root, package_path, self.model.original_file_path
+            )
+            if not os.path.exists(path):
+                assert self.model.root_path
+                path = os.path.join(self.model.root_path, self.model.original_file_path)
+            self._agate_table_path = path
+        return path
+
     @contextmember()
     def load_agate_table(self) -> "agate.Table":
         from dbt_common.clients import agate_helper
@@ -1133,23 +1495,28 @@ class ProviderContext(ManifestContext):
         if not isinstance(self.model, SeedNode):
             raise LoadAgateTableNotSeedError(self.model.resource_type, node=self.model)
 
-        # include package_path for seeds defined in packages
-        package_path = (
-            os.path.join(self.config.packages_install_path, self.model.package_name)
-            if self.model.package_name != self.config.project_name
-            else "."
-        )
-        path = os.path.join(self.config.project_root, package_path, self.model.original_file_path)
-        if not os.path.exists(path):
-            assert self.model.root_path
-            path = os.path.join(self.model.root_path, self.model.original_file_path)
-
+        path = self._get_agate_table_path()
         column_types = self.model.config.column_types
         delimiter = self.model.config.delimiter
+
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types, delimiter=delimiter)
-        except ValueError as e:
-            raise LoadAgateTableValueError(e, node=self.model)
+            mtime: Optional[float] = os.path.getmtime(path)
+        except OSError:
+            # let from_csv surface the error for a missing file
+            mtime = None
+        cache_key = (
+            path,
+            mtime,
+            delimiter,
+            frozenset(column_types.items()) if column_types else None,
+        )
+        table = _agate_table_cache.get(cache_key)
+        if table is None:
+            try:
+                table = agate_helper.from_csv(path, text_columns=column_types, delimiter=delimiter)
+            except ValueError as e:
+                raise LoadAgateTableValueError(e, node=self.model)
+            _agate_table_cache[cache_key] = table
         # this is used by some adapters
         table.original_abspath = os.path.abspath(path)  # type: ignore
         return table
@@ -1519,11 +1886,16 @@ class ProviderContext(ManifestContext):
             and self.model.contract.alias_types is True
             and "columns" in model_dct
         ):
+            column_cls = self.adapter.Column
             for column in model_dct["columns"].values():
                 if "data_type" in column:
                     orig_data_type = column["data_type"]
                     # translate data_type to value in Column.TYPE_LABELS
-                    new_data_type = self.adapter.Column.translate_type(orig_data_type)
+                    cache_key = (column_cls, orig_data_type)
+                    new_data_type = _translated_type_cache.get(cache_key)
+                    if new_data_type is None:
+                        new_data_type = column_cls.translate_type(orig_data_type)
+                        _translated_type_cache[cache_key] = new_data_type
                     column["data_type"] = new_data_type
         return model_dct
 
@@ -1566,29 +1938,30 @@ class ProviderContext(ManifestContext):
         if var.startswith(SECRET_ENV_PREFIX):
             raise SecretEnvVarLocationError(var)
 
-        env = get_invocation_context().env
+        # env var names key several dicts below (the invocation env, the
+        # manifest, the per-context recorded set); interning makes those
+        # lookups pointer comparisons for templates that call env_var often
+        var = sys.intern(var)
+
+        env_value = get_invocation_context().env.get(var, _MISSING)
 
-        if var in env:
-            return_value = env[var]
+        if env_value is not _MISSING:
+            # the invocation env only holds strings; tell mypy so, since the
+            # _MISSING sentinel widened env_value to object
+            return_value = cast(str, env_value)
         elif default is not None:
             return_value = default
 
         if return_value is not None:
             # Save the env_var value in the manifest and the var name in the source_file.
-            # If this is compiling, do not save because it's irrelevant to parsing.
-            compiling = (
-                True
-                if hasattr(self.model, "compiled")
-                and getattr(self.model, "compiled", False) is True
-                else False
-            )
-            if self.model and not compiling:
+            if self.model and not self._compiling and var not in self._recorded_env_vars:
+                self._recorded_env_vars.add(var)
                 # If the environment variable is set from a default, store a string indicating
                 # that so we can skip partial parsing.  Otherwise the file will be scheduled for
                 # reparsing. If the default changes, the file will have been updated and therefore
                 # will be scheduled for reparsing anyways.
                 self.manifest.env_vars[var] = (
-                    return_value if var in env else DEFAULT_ENV_PLACEHOLDER
+                    return_value if env_value is not _MISSING else DEFAULT_ENV_PLACEHOLDER
                 )
 
                 # hooks come from dbt_project.yml which doesn't have a real file_id
@@ -1614,13 +1987,14 @@ class ProviderContext(ManifestContext):
     @contextmember()
     def submit_python_job(self, parsed_model: Dict, compiled_code: str) -> AdapterResponse:
         # Check macro_stack and that the unique id is for a materialization macro
+        call_stack = self.context_macro_stack.call_stack
         if not (
             self.context_macro_stack.depth == 2
-            and self.context_macro_stack.call_stack[1] == "macro.dbt.statement"
-            and "materialization" in self.context_macro_stack.call_stack[0]
+            and call_stack[1] == "macro.dbt.statement"
+            and "materialization" in call_stack[0]
         ):
             raise DbtRuntimeError(
-                f"submit_python_job is not intended to be called here, at model {parsed_model['alias']}, with macro call_stack {self.context_macro_stack.call_stack}."
+                f"submit_python_job is not intended to be called here, at model {parsed_model['alias']}, with macro call_stack {call_stack}."
             )
         return self.adapter.submit_python_job(parsed_model, compiled_code)
 
@@ -1670,7 +2044,7 @@ class ModelContext(ProviderContext):
 
     @contextproperty()
     def pre_hooks(self) -> List[Dict[str, Any]]:
-        if self.model.resource_type in [NodeType.Source, NodeType.Test, NodeType.Unit]:
+        if self.model.resource_type in _NO_HOOK_TYPES:
             return []
         # TODO CT-211
         return [
@@ -1679,7 +2053,7 @@ class ModelContext(ProviderContext):
 
     @contextproperty()
     def post_hooks(self) -> List[Dict[str, Any]]:
-        if self.model.resource_type in [NodeType.Source, NodeType.Test, NodeType.Unit]:
+        if self.model.resource_type in _NO_HOOK_TYPES:
             return []
         # TODO CT-211
         return [
@@ -1689,9 +2063,10 @@ class ModelContext(ProviderContext):
     @contextproperty()
     def compiled_code(self) -> Optional[str]:
         # TODO: avoid routing on args.which if possible
-        if getattr(self.model, "defer_relation", None) and self.config.args.which == "clone":
+        defer_relation = getattr(self.model, "defer_relation", None)
+        if defer_relation and self.config.args.which == "clone":
             # TODO https://github.com/dbt-labs/dbt-core/issues/7976
-            return f"select * from {self.model.defer_relation.relation_name or str(self.defer_relation)}"  # type: ignore[union-attr]
+            return f"select * from {defer_relation.relation_name or str(self.defer_relation)}"
         elif getattr(self.model, "extra_ctes_injected", None):
             # TODO CT-211
             return self.model.compiled_code  # type: ignore[union-attr]
@@ -1756,10 +2131,9 @@ class ModelContext(ProviderContext):
         production version (via a --state artifact), access the Relation
         object for that stateful other
         """
-        if getattr(self.model, "defer_relation", None):
-            return self.db_wrapper.Relation.create_from(
-                self.config, self.model.defer_relation  # type: ignore
-            )
+        defer_relation = getattr(self.model, "defer_relation", None)
+        if defer_relation:
+            return self.db_wrapper.Relation.create_from(self.config, defer_relation)
         else:
             return None
 
@@ -1777,10 +2151,11 @@ class UnitTestContext(ModelContext):
 
         If the default is None, raise an exception for an undefined variable.
         """
-        if self.model.overrides and var in self.model.overrides.env_vars:
-            return self.model.overrides.env_vars[var]
-        else:
-            return super().env_var(var, default)
+        if self.model.overrides:
+            override = self.model.overrides.env_vars.get(var, _MISSING)
+            if override is not _MISSING:
+                return override
+        return super().env_var(var, default)
 
     @contextproperty()
     def this(self) -> Optional[str]:
@@ -1801,7 +2176,7 @@ def generate_parser_model_context(
     # The __init__ method of ModelContext also initializes
     # a ManifestContext object which creates a MacroNamespaceBuilder
     # which adds every macro in the Manifest.
-    ctx = ModelContext(model, config, manifest, ParseProvider(), context_config)
+    ctx = ModelContext(model, config, manifest, _PARSE_PROVIDER, context_config)
     # The 'to_dict' method in ManifestContext moves all of the macro names
     # in the macro 'namespace' up to top level keys
     return ctx.to_dict()
@@ -1812,7 +2187,7 @@ def generate_generate_name_macro_context(
     config: RuntimeConfig,
     manifest: Manifest,
 ) -> Dict[str, Any]:
-    ctx = MacroContext(macro, config, manifest, GenerateNameProvider(), None)
+    ctx = MacroContext(macro, config, manifest, _GENERATE_NAME_PROVIDER, None)
     return ctx.to_dict()
 
 
@@ -1821,18 +2196,51 @@ def generate_runtime_model_context(
     config: RuntimeConfig,
     manifest: Manifest,
 ) -> Dict[str, Any]:
-    ctx = ModelContext(model, config, manifest, RuntimeProvider(), None)
+    ctx = ModelContext(model, config, manifest, _RUNTIME_PROVIDER, None)
     return ctx.to_dict()
 
 
+# Macro contexts built by generate_runtime_macro_context, which the
+# adapter calls for every execute_macro. Building one walks every macro in
+# the manifest, and the result only depends on the macro, package, config,
+# and manifest, so reuse it while those stay the same. The cache is
+# thread-local because the context closes over per-instance state (the sql
+# results, the macro stack) that must not be shared across threads; each
+# entry is handed out as a shallow copy so callers can overlay their own
+# top-level keys. Note that such overlays are only visible in the copy
+# itself: macro generators in the namespace still close over the cached
+# dict, so nested macro calls don't see caller overrides.
+_macro_ctx_cache = threading.local()
+
+
 def generate_runtime_macro_context(
     macro: MacroProtocol,
     config: RuntimeConfig,
     manifest: Manifest,
     package_name: Optional[str],
 ) -> Dict[str, Any]:
-    ctx = MacroContext(macro, config, manifest, OperationProvider(), package_name)
-    return ctx.to_dict()
+    cache: Optional[Dict[Tuple[str, Optional[str]], Tuple[MacroContext, Dict[str, Any]]]]
+    cache = getattr(_macro_ctx_cache, "entries", None)
+    token = getattr(_macro_ctx_cache, "token", None)
+    if cache is None or token is None or token[0] is not config or token[1] is not manifest:
+        cache = _macro_ctx_cache.entries = {}
+        _macro_ctx_cache.token = (config, manifest)
+
+    # everything the adapter hands us here is a parsed Macro node
+    key = (cast(Macro, macro).unique_id, package_name)
+    entry = cache.get(key)
+    if entry is None:
+        ctx = MacroContext(macro, config, manifest, _OPERATION_PROVIDER, package_name)
+        entry = cache[key] = (ctx, ctx.to_dict())
+    else:
+        # drop statement results left over from a previous execute_macro of
+        # this macro, so a stale load_result marker can't leak into this run
+        entry[0].sql_results.clear()
+    macro_ctx = dict(entry[1])
+    # keep the self-reference pointing at this copy so caller overlays stay
+    # visible through the 'context' key, as they were pre-caching
+    macro_ctx["context"] = macro_ctx
+    return macro_ctx
 
 
 def generate_runtime_unit_test_context(
@@ -1840,56 +2248,65 @@ def generate_runtime_unit_test_context(
     config: RuntimeConfig,
     manifest: Manifest,
 ) -> Dict[str, Any]:
-    ctx = UnitTestContext(unit_test, config, manifest, RuntimeUnitTestProvider(), None)
+    ctx = UnitTestContext(unit_test, config, manifest, _RUNTIME_UNIT_TEST_PROVIDER, None)
     ctx_dict = ctx.to_dict()
 
     if unit_test.overrides and unit_test.overrides.macros:
-        global_macro_overrides: Dict[str, Any] = {}
-        package_macro_overrides: Dict[Tuple[str, str], Any] = {}
-
-        # split macro overrides into global and package-namespaced collections
+        # split the override keys into global and package-namespaced
+        # collections once, instead of re-parsing them while applying
+        global_macro_overrides: List[Tuple[str, Any]] = []
+        package_macro_overrides: List[Tuple[str, str, Any]] = []
         for macro_name, macro_value in unit_test.overrides.macros.items():
             macro_name_split = macro_name.split(".")
-            macro_package = macro_name_split[0] if len(macro_name_split) == 2 else None
-            macro_name = macro_name_split[-1]
-
-            # macro overrides of global macros
-            if macro_package is None and macro_name in ctx_dict:
-                original_context_value = ctx_dict[macro_name]
-                if isinstance(original_context_value, MacroGenerator):
-                    macro_value = UnitTestMacroGenerator(original_context_value, macro_value)
-                global_macro_overrides[macro_name] = macro_value
-
-            # macro overrides of package-namespaced macros
-            elif (
-                macro_package
-                and macro_package in ctx_dict
-                and macro_name in ctx_dict[macro_package]
-            ):
-                original_context_value = ctx_dict[macro_package][macro_name]
-                if isinstance(original_context_value, MacroGenerator):
-                    macro_value = UnitTestMacroGenerator(original_context_value, macro_value)
-                package_macro_overrides[(macro_package, macro_name)] = macro_value
+            if len(macro_name_split) == 2:
+                package_macro_overrides.append(
+                    (macro_name_split[0], macro_name_split[1], macro_value)
+                )
+            else:
+                global_macro_overrides.append((macro_name_split[-1], macro_value))
 
         # macro overrides of package-namespaced macros
-        for (macro_package, macro_name), macro_override_value in package_macro_overrides.items():
-            ctx_dict[macro_package][macro_name] = macro_override_value
+        for macro_package, macro_name, macro_value in package_macro_overrides:
+            package_namespace = ctx_dict.get(macro_package)
+            if package_namespace is None or macro_name not in package_namespace:
+                continue
+            original_context_value = package_namespace[macro_name]
+            if isinstance(original_context_value, MacroGenerator):
+                macro_value = UnitTestMacroGenerator(original_context_value, macro_value)
+            package_namespace[macro_name] = macro_value
             # propgate override of namespaced dbt macro to global namespace
             if macro_package == "dbt":
                 ctx_dict[macro_name] = macro_value
 
         # macro overrides of global macros, which should take precedence over equivalent package-namespaced overrides
-        for macro_name, macro_override_value in global_macro_overrides.items():
-            ctx_dict[macro_name] = macro_override_value
+        for macro_name, macro_value in global_macro_overrides:
+            if macro_name not in ctx_dict:
+                continue
+            original_context_value = ctx_dict[macro_name]
+            if isinstance(original_context_value, MacroGenerator):
+                macro_value = UnitTestMacroGenerator(original_context_value, macro_value)
+            ctx_dict[macro_name] = macro_value
             # propgate override of global dbt macro to dbt namespace
             if ctx_dict["dbt"].get(macro_name):
-                ctx_dict["dbt"][macro_name] = macro_override_value
+                ctx_dict["dbt"][macro_name] = macro_value
 
     return ctx_dict
 
 
-class ExposureRefResolver(BaseResolver):
-    def __call__(self, *args, **kwargs) -> str:
+class ExposureResolver:
+    """Records the ref/source/metric dependencies of an exposure.
+
+    Exposures only collect their dependency arguments at parse time, so a
+    single object holding the exposure can provide all three callables
+    instead of three BaseResolver instances with identical state.
+    """
+
+    __slots__ = ("model",)
+
+    def __init__(self, exposure: Exposure) -> None:
+        self.model = exposure
+
+    def ref(self, *args, **kwargs) -> str:
         package = None
         if len(args) == 1:
             name = args[0]
@@ -1900,20 +2317,16 @@ class ExposureRefResolver(BaseResolver):
 
         version = kwargs.get("version") or kwargs.get("v")
 
-        self.model.refs.append(RefArgs(package=package, name=name, version=version))
+        self.model.refs.append(RefArgs(name, package, version))
         return ""
 
-
-class ExposureSourceResolver(BaseResolver):
-    def __call__(self, *args) -> str:
+    def source(self, *args) -> str:
         if len(args) != 2:
             raise NumberSourceArgsError(args, node=self.model)
         self.model.sources.append(list(args))
         return ""
 
-
-class ExposureMetricResolver(BaseResolver):
-    def __call__(self, *args) -> str:
+    def metric(self, *args) -> str:
         if len(args) not in (1, 2):
             raise MetricArgsError(node=self.model, args=args)
         self.model.metrics.append(list(args))
@@ -1926,31 +2339,18 @@ def generate_parse_exposure(
     manifest: Manifest,
     package_name: str,
 ) -> Dict[str, Any]:
-    project = config.load_dependencies()[package_name]
+    resolver = ExposureResolver(exposure)
     return {
-        "ref": ExposureRefResolver(
-            None,
-            exposure,
-            project,
-            manifest,
-        ),
-        "source": ExposureSourceResolver(
-            None,
-            exposure,
-            project,
-            manifest,
-        ),
-        "metric": ExposureMetricResolver(
-            None,
-            exposure,
-            project,
-            manifest,
-        ),
+        "ref": resolver.ref,
+        "source": resolver.source,
+        "metric": resolver.metric,
     }
 
 
 # applies to SemanticModels
 class SemanticModelRefResolver(BaseResolver):
+    __slots__ = ()
+
     def __call__(self, *args, **kwargs) -> str:
         package = None
         if len(args) == 1:
@@ -1964,7 +2364,7 @@ class SemanticModelRefResolver(BaseResolver):
         self.validate_args(name, package, version)
 
         # "model" here is any node
-        self.model.refs.append(RefArgs(package=package, name=name, version=version))
+        self.model.refs.append(RefArgs(name, package, version))
         return ""
 
     def validate_args(self, name, package, version):
@@ -2032,11 +2432,12 @@ class TestContext(ProviderContext):
             depends_on_macros.append(get_where_subquery.unique_id)
         if self.model.depends_on and self.model.depends_on.macros:
             depends_on_macros.extend(self.model.depends_on.macros)
-        lookup_macros = depends_on_macros.copy()
-        for macro_unique_id in lookup_macros:
-            lookup_macro = self.macro_resolver.macros.get(macro_unique_id)
-            if lookup_macro:
-                depends_on_macros.extend(lookup_macro.depends_on.macros)
+        # Generic tests repeat macros between get_where_subquery and their own
+        # depends_on; dedupe (preserving order) so TestMacroNamespace doesn't
+        # re-walk the same subgraphs. The namespace's recursive walk closes
+        # the full dependency graph from these seeds, so there's no need to
+        # pre-expand a level of dependencies here.
+        depends_on_macros = list(dict.fromkeys(depends_on_macros))
 
         macro_namespace = TestMacroNamespace(
             self.macro_resolver, self._ctx, self.model, self.thread_ctx, depends_on_macros
@@ -2049,9 +2450,13 @@ class TestContext(ProviderContext):
         if var.startswith(SECRET_ENV_PREFIX):
             raise SecretEnvVarLocationError(var)
 
-        env = get_invocation_context().env
-        if var in env:
-            return_value = env[var]
+        var = sys.intern(var)
+
+        env_value = get_invocation_context().env.get(var, _MISSING)
+        if env_value is not _MISSING:
+            # the invocation env only holds strings; tell mypy so, since the
+            # _MISSING sentinel widened env_value to object
+            return_value = cast(str, env_value)
         elif default is not None:
             return_value = default
 
@@ -2063,7 +2468,7 @@ class TestContext(ProviderContext):
                 # reparsing. If the default changes, the file will have been updated and therefore
                 # will be scheduled for reparsing anyways.
                 self.manifest.env_vars[var] = (
-                    return_value if var in env else DEFAULT_ENV_PLACEHOLDER
+                    return_value if env_value is not _MISSING else DEFAULT_ENV_PLACEHOLDER
                 )
                 # the "model" should only be test nodes, but just in case, check
                 # TODO CT-211
@@ -2085,7 +2490,7 @@ def generate_test_context(
     context_config: ContextConfig,
     macro_resolver: MacroResolver,
 ) -> Dict[str, Any]:
-    ctx = TestContext(model, config, manifest, ParseProvider(), context_config, macro_resolver)
+    ctx = TestContext(model, config, manifest, _PARSE_PROVIDER, context_config, macro_resolver)
     # The 'to_dict' method in ManifestContext moves all of the macro names
     # in the macro 'namespace' up to top level keys
     return ctx.to_dict()